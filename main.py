@@ -14,19 +14,36 @@ This script offers two modes:
       - Generate a shell script 'individual_files.sh' with the selected file paths.
 
 For both modes, the script:
-  • Reads each file’s contents (skipping files with empty contents) and builds a single prompt string in the format:
+  • Reads each file’s contents (skipping empty, binary, and very large files) and builds a single prompt string in the format:
       My codebase includes
       'path/to/file1' with 'file1 contents',
       'path/to/file2' with 'file2 contents',
       …
       .
   • Saves the final prompt in "codebase_prompt.txt".
+  • Keeps an index of the previous prompt (in the user cache directory) so unchanged files are
+    copied from it instead of being re-read on later runs.
+
+Run without arguments for the interactive flow above, or pass --mode (with --target or
+--files-from) to run non-interactively, e.g. from CI. See --help for all options.
 
 No external dependencies are required.
 """
 
+import argparse
+import hashlib
 import os
+import pickle
+import re
+import stat
 import sys
+import tempfile
+import timeit
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 # File names for the ignore list, output prompt, and individual files script.
@@ -35,35 +52,155 @@ OUTPUT_FILE = 'codebase_prompt.txt'
 INDIVIDUAL_FILES_SCRIPT = 'individual_files.sh'
 TARGET_FILES_FILE = 'target_files.txt'
 
+# The previous prompt doubles as a cache: an index recording where each file's
+# escaped contents sit in it (keyed by absolute path, validated against the file's
+# modification time and size) is kept in the user cache directory, never inside
+# the scanned tree. Bump CACHE_VERSION whenever the way contents are read or
+# escaped changes.
+CACHE_VERSION = 4
+
+# The process umask, which decides the mode of newly created prompts. It can only
+# be read by setting it, so that is done once here rather than on every write.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+# Translation table used to escape single quotes in file paths.
+_ESC = str.maketrans({"'": "\\'"})
+
+# Pattern used by the regex-based escaping primitive.
+_QUOTE_RE = re.compile(rb"'")
+
+
+def _escape_replace(data):
+    """Escape single quotes with bytes.replace."""
+    return data.replace(b"'", b"\\'")
+
+
+def _escape_regex(data):
+    """Escape single quotes with a precompiled regular expression."""
+    return _QUOTE_RE.sub(rb"\\'", data)
+
+
+def _pick_escape():
+    """
+    Time each escaping primitive on a synthetic 64 KiB sample with 1% single quotes
+    and return the fastest one on this interpreter/platform.
+    """
+    sample = (b"x" * 99 + b"'") * 656
+    candidates = (_escape_replace, _escape_regex)
+    return min(candidates, key=lambda escape: min(timeit.repeat(lambda: escape(sample), number=5, repeat=3)))
+
+
+# Escaping primitive used for file contents, chosen once at import time.
+_escape = _pick_escape()
+
+
+def _env_int(name, default):
+    """
+    Read a positive integer setting from the environment variable name.
+    Unset or empty values give default; anything else that is not a positive
+    integer is reported and also falls back to default.
+    """
+    value = os.environ.get(name, '').strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        print(f"Warning: ignoring {name}={value!r} (expected a positive integer); using {default}.")
+        return default
+    return number
+
+
+# Files larger than this many bytes are left out of the prompt (override with
+# LOADBASE_MAX_FILE_BYTES), and files with a NUL byte in their first SNIFF_BYTES
+# are treated as binary and skipped.
+MAX_FILE_BYTES = _env_int('LOADBASE_MAX_FILE_BYTES', 2 << 20)
+SNIFF_BYTES = 4096
+
+# Matches any byte str.strip() would keep, i.e. anything but ASCII whitespace
+# (which for str also covers the \x1c-\x1f separators, unlike bytes.isspace()).
+_NON_SPACE_RE = re.compile(rb"[^ \t\n\r\x0b\x0c\x1c-\x1f]")
+
+# Number of paths joined into a single write when saving the individual files script.
+SCRIPT_WRITE_CHUNK = 10000
+
+# Number of threads reading files in parallel (override with LOADBASE_JOBS),
+# and how many reads may be in flight ahead of the writer.
+READ_WORKERS = _env_int('LOADBASE_JOBS', min(32, (os.cpu_count() or 1) * 4))
+READ_AHEAD = 64
+
+
+def _prefix_free(sorted_prefixes):
+    """
+    Return the already sorted prefixes as a tuple, dropping any entry covered
+    by a shorter prefix (e.g. 'src/app' when 'src' is present).
+    """
+    kept = []
+    for prefix in sorted_prefixes:
+        if kept and prefix.startswith(kept[-1]):
+            continue
+        kept.append(prefix)
+    return tuple(kept)
+
 
-def load_ignore_paths():
-    """Load existing ignore paths from the ignore file, if it exists."""
+@dataclass(frozen=True)
+class IgnoreSpec:
+    """
+    The ignore paths, sorted once and shared by everything that needs them:
+    saving and listing use sorted_paths, the walker uses the sorted, prefix-free
+    abs_prefixes and rel_prefixes for bisect matching.
+    """
+    paths: frozenset
+    sorted_paths: tuple
+    abs_prefixes: tuple
+    rel_prefixes: tuple
+
+    @classmethod
+    def from_paths(cls, paths):
+        """Build a spec from an iterable of ignore paths."""
+        paths = frozenset(paths)
+        sorted_paths = tuple(sorted(paths))
+        return cls(
+            paths=paths,
+            sorted_paths=sorted_paths,
+            abs_prefixes=_prefix_free(p for p in sorted_paths if os.path.isabs(p)),
+            rel_prefixes=_prefix_free(p for p in sorted_paths if not os.path.isabs(p)),
+        )
+
+
+def load_ignore_paths(ignore_file=IGNORE_FILE):
+    """Load existing ignore paths from the ignore file, if it exists, as an IgnoreSpec."""
     ignore_set = set()
-    if os.path.exists(IGNORE_FILE):
-        with open(IGNORE_FILE, 'r', encoding='utf-8') as f:
+    if os.path.exists(ignore_file):
+        with open(ignore_file, 'r', encoding='utf-8') as f:
             for line in f:
                 line = line.strip()
                 if line:
                     ignore_set.add(line)
-    return ignore_set
+    return IgnoreSpec.from_paths(ignore_set)
 
 
-def save_ignore_paths(ignore_set):
-    """Save the ignore paths to the ignore file."""
-    with open(IGNORE_FILE, 'w', encoding='utf-8') as f:
-        for path in sorted(ignore_set):
+def save_ignore_paths(ignore_spec, ignore_file=IGNORE_FILE):
+    """Save the ignore paths of an IgnoreSpec to the ignore file."""
+    with open(ignore_file, 'w', encoding='utf-8') as f:
+        for path in ignore_spec.sorted_paths:
             f.write(path + "\n")
 
 
-def prompt_for_ignore_paths(existing_ignore_set):
+def prompt_for_ignore_paths(ignore_spec):
     """
     Prompt the user to enter file or directory paths to ignore.
     Paths can be entered either as relative (to the target folder) or absolute paths.
     Duplicate entries are ignored.
+    Returns a new IgnoreSpec including the added paths.
     """
+    existing_ignore_set = set(ignore_spec.paths)
     print("\nCurrent ignore paths:")
-    if existing_ignore_set:
-        for path in sorted(existing_ignore_set):
+    if ignore_spec.sorted_paths:
+        for path in ignore_spec.sorted_paths:
             print(" -", path)
     else:
         print(" (none)")
@@ -80,52 +217,353 @@ def prompt_for_ignore_paths(existing_ignore_set):
         else:
             existing_ignore_set.add(user_input)
             print(f"Added '{user_input}' to ignore list.")
-    return existing_ignore_set
+    return IgnoreSpec.from_paths(existing_ignore_set)
 
 
-def should_ignore(file_path, target_folder, ignore_set):
+def _matches_prefix(prefixes, path):
     """
-    Determine whether a file should be ignored.
-    If an ignore entry is an absolute path, compare it to the file's absolute path.
-    Otherwise, compare the file's path relative to the target folder.
+    Check whether path starts with any entry of the sorted, prefix-free tuple.
+    The only candidate is the greatest entry that sorts at or before path.
     """
-    abs_file = file_path.resolve()
-    try:
-        rel_file = file_path.relative_to(target_folder).as_posix()
-    except ValueError:
-        # If file_path is not under target_folder, ignore it.
-        return True
+    idx = bisect_right(prefixes, path) - 1
+    return idx >= 0 and path.startswith(prefixes[idx])
 
-    for ignore in ignore_set:
-        if os.path.isabs(ignore):
-            # Check against the absolute path string.
-            if str(abs_file).startswith(ignore):
-                return True
-        else:
-            # Check against the relative path string.
-            if rel_file.startswith(ignore):
-                return True
-    return False
+
+def should_ignore(rel_path, abs_path, rel_prefixes, abs_prefixes):
+    """
+    Determine whether a path should be ignored.
+    Relative ignore entries are compared to the path relative to the target folder
+    (always using '/' as separator); absolute entries are compared to its absolute path.
+    abs_path may be None when there are no absolute ignore entries.
+    """
+    if _matches_prefix(rel_prefixes, rel_path):
+        return True
+    return abs_path is not None and _matches_prefix(abs_prefixes, abs_path)
 
 
-def get_all_files(target_folder, ignore_set):
+def _walk(root, rel, rel_prefixes, abs_prefixes, resolve_symlinks, out, warnings):
+    """
+    Depth-first scan of root using os.scandir, appending
+    (path, relative_path, size, mtime_ns) tuples for every file that is not ignored to out.
+    A directory's files are listed before the contents of its subdirectories,
+    in the same order Path.rglob produced.
+    root must already be resolved: since symlinked directories are never descended,
+    entry.path is then the real absolute path of every non-symlink entry.
+    Directories matching an ignore path are pruned without descending into them.
+    Unreadable directories and entries that vanish mid-walk are reported via
+    report(warnings, ...) and skipped.
     """
-    Recursively walk the target folder and return a list of file paths (as Path objects)
-    that do not match any of the ignore paths.
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                entry_rel = rel + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Every file below this directory starts with entry_rel + "/",
+                        # so if that prefix is ignored the whole subtree is.
+                        abs_dir = entry.path + os.sep if abs_prefixes else None
+                        if not should_ignore(entry_rel + "/", abs_dir, rel_prefixes, abs_prefixes):
+                            subdirs.append((entry.path, entry_rel + "/"))
+                    elif entry.is_file():
+                        abs_file = None
+                        if abs_prefixes:
+                            abs_file = entry.path
+                            if resolve_symlinks and entry.is_symlink():
+                                abs_file = os.path.realpath(abs_file)
+                        if not should_ignore(entry_rel, abs_file, rel_prefixes, abs_prefixes):
+                            st = entry.stat()
+                            out.append((entry.path, entry_rel, st.st_size, st.st_mtime_ns))
+                except OSError as e:
+                    report(warnings, f"Error reading {entry.path}: {e}")
+    except OSError as e:
+        report(warnings, f"Error reading directory {root}: {e}")
+    for path, path_rel in subdirs:
+        _walk(path, path_rel, rel_prefixes, abs_prefixes, resolve_symlinks, out, warnings)
+
+
+def get_all_files(target_folder, ignore_spec, resolve_symlinks=False, warnings=None):
+    """
+    Recursively walk the target folder and return a list of
+    (path, relative_path, size, mtime_ns) tuples for the files that do not
+    match any of the paths in ignore_spec (an IgnoreSpec).
+    The target folder is resolved once; absolute ignore paths are matched
+    against symlinked files by their link location unless resolve_symlinks is set.
+    Unreadable directories and files are reported via report(warnings, ...).
     """
     files_to_include = []
-    target_path = Path(target_folder)
-    for file_path in target_path.rglob('*'):
-        if file_path.is_file():
-            if not should_ignore(file_path, target_path, ignore_set):
-                files_to_include.append(file_path)
+    root = str(Path(target_folder).resolve())
+    _walk(root, "", ignore_spec.rel_prefixes, ignore_spec.abs_prefixes, resolve_symlinks,
+          files_to_include, warnings)
     return files_to_include
 
 
-def generate_prompt(target_folder, files):
+class SkippedFile(Exception):
+    """Raised for files that are deliberately left out of the prompt (binary or too large)."""
+
+
+def read_file_bytes(file_path, size=None):
     """
-    Generate a single prompt string that lists each file (by its relative path)
-    along with its full contents in the format:
+    Read a file as raw bytes, skipping the buffered and text I/O stacks.
+    When the size is already known (from the directory walk) the whole file
+    is fetched with a single read() call.
+    Files larger than MAX_FILE_BYTES, or with a NUL byte in their first
+    SNIFF_BYTES, raise SkippedFile before the full contents are read.
+    ASCII files are returned as-is; anything else is validated as UTF-8
+    (raising UnicodeDecodeError otherwise), and comes back as b"" if it holds
+    only whitespace. Line endings are normalized to '\\n' as text mode would.
+    """
+    if size is not None and size > MAX_FILE_BYTES:
+        raise SkippedFile(f"larger than {MAX_FILE_BYTES} bytes")
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if size is None:
+            size = os.fstat(fd).st_size
+            if size > MAX_FILE_BYTES:
+                raise SkippedFile(f"larger than {MAX_FILE_BYTES} bytes")
+        # NUL bytes are a strong binary indicator. Small files are checked after
+        # the single full read; larger ones are sniffed first so binaries are not
+        # read in full.
+        head = b""
+        if size > SNIFF_BYTES:
+            head = os.read(fd, SNIFF_BYTES)
+            if b'\x00' in head:
+                raise SkippedFile("binary file")
+        # Ask for one extra byte so the common case is a single read. Otherwise
+        # keep reading to EOF: the read may have come up short (Linux caps one
+        # read() at about 2 GiB, FUSE and network filesystems may return less),
+        # or the file may have grown since it was listed.
+        data = head + os.read(fd, size - len(head) + 1)
+        if len(data) != size:
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 1 << 20)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    if size <= SNIFF_BYTES and b'\x00' in data:
+        raise SkippedFile("binary file")
+    if not data.isascii():
+        # Validating as UTF-8 already decodes the file, so reuse the text to spot
+        # files holding only (possibly non-ASCII) whitespace, as str.strip() would.
+        if data.decode('utf-8').isspace():
+            return b""
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return data
+
+
+def read_and_escape(file_path, size=None):
+    """
+    Read a file and escape its single quotes.
+    Returns None if the file is empty after stripping whitespace.
+    """
+    contents = read_file_bytes(file_path, size)
+    # The search stops at the first non-whitespace byte instead of building a stripped copy.
+    if not contents or not _NON_SPACE_RE.search(contents):
+        return None
+    # Many files contain no single quotes at all; a memchr-backed find lets them
+    # skip the escape pass (and its copy) entirely.
+    if contents.find(b"'") < 0:
+        return contents
+    return _escape(contents)
+
+
+def _cache_path(out_path):
+    """Return the path of the index for the prompt at out_path, inside the user cache directory."""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base and os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha1(os.fsencode(os.path.abspath(out_path))).hexdigest()[:16]
+    return os.path.join(base, 'loadbase', digest + '.pickle')
+
+
+def load_prompt_index(out_path):
+    """
+    Load the index saved with the previous prompt at out_path.
+    Returns a dict mapping absolute file paths to (mtime_ns, size, offset, length),
+    where offset/length locate the file's escaped contents in that prompt (both None
+    for whitespace-only files). Returns an empty dict if there is no usable index,
+    including when the prompt was changed after the index was saved.
+    """
+    try:
+        with open(_cache_path(out_path), 'rb') as f:
+            version, prompt_key, index = pickle.load(f)
+        st = os.stat(out_path)
+    except Exception:
+        return {}
+    if version != CACHE_VERSION or prompt_key != (st.st_size, st.st_mtime_ns):
+        return {}
+    return index
+
+
+def save_prompt_index(out_path, index):
+    """Save the index for the prompt just written to out_path."""
+    cache_path = _cache_path(out_path)
+    try:
+        st = os.stat(out_path)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with atomic_output(cache_path) as f:
+            pickle.dump((CACHE_VERSION, (st.st_size, st.st_mtime_ns), index), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"Warning: could not save cache '{cache_path}': {e}")
+
+
+def _read_previous(previous, offset, length):
+    """
+    Read a file's escaped contents out of the previous prompt.
+    Entries come in roughly the same order as last run, so these seeks mostly
+    land inside the reader's buffer and cost no system call.
+    """
+    if offset is None:
+        return None
+    previous.seek(offset)
+    contents = previous.read(length)
+    if len(contents) != length:
+        raise OSError("cached entry is truncated")
+    return contents
+
+
+def _read_ahead(entries, jobs, index, previous):
+    """
+    Read and escape (file_path, identifier, size, mtime_ns) entries on a thread pool,
+    yielding (file_path, identifier, cache_key, contents) in the original order.
+    Entries unchanged since the previous prompt (per index) are copied out of it
+    and yield their contents directly; the rest yield the Future of their read.
+    At most READ_AHEAD entries are in flight at once so memory stays bounded
+    while the writer drains results.
+    """
+    with ThreadPoolExecutor(max_workers=jobs or READ_WORKERS) as pool:
+        pending = deque()
+        for file_path, identifier, size, mtime_ns in entries:
+            key = cached = None
+            # Oversized files go straight to read_file_bytes, which reports them.
+            if mtime_ns is not None and size <= MAX_FILE_BYTES:
+                key = (os.path.abspath(file_path), mtime_ns, size)
+                cached = index.get(key[0])
+            if previous is not None and cached is not None and cached[:2] == key[1:]:
+                try:
+                    contents = _read_previous(previous, cached[2], cached[3])
+                except Exception:
+                    # The previous prompt is truncated or unreadable; the file
+                    # itself is still fine, so read it instead.
+                    contents = pool.submit(read_and_escape, file_path, size)
+            else:
+                contents = pool.submit(read_and_escape, file_path, size)
+            pending.append((file_path, identifier, key, contents))
+            if len(pending) >= READ_AHEAD:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+@contextmanager
+def atomic_output(out_path):
+    """
+    Open a temporary file next to out_path for buffered binary writing and
+    atomically move it into place on success, so an interrupted run never
+    leaves a truncated prompt behind. If out_path is a symlink, its target is
+    replaced and the link is left in place.
+    """
+    out_path = os.path.realpath(out_path)
+    tmp = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(out_path) or '.',
+                                      prefix='.' + os.path.basename(out_path) + '.',
+                                      delete=False, buffering=1 << 20)
+    try:
+        with tmp:
+            yield tmp
+        # NamedTemporaryFile is created 0600. Keep the mode of the file being replaced
+        # (e.g. a prompt the user restricted to 0600); new files get the usual umask-based mode.
+        try:
+            mode = stat.S_IMODE(os.stat(out_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, out_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def report(warnings, message):
+    """
+    Print a per-file warning right away, or collect it into the warnings list
+    so it can be summarized once at the end of the run.
+    """
+    if warnings is None:
+        print(message)
+    else:
+        warnings.append(message)
+
+
+def _write_entries(entries, out_path, jobs, warnings):
+    """
+    Stream the prompt for (file_path, identifier, size, mtime_ns) entries to out_path.
+    Files are read in parallel but written in order, as soon as each is ready.
+    Files unchanged since the previous run are copied out of the previous prompt
+    instead of being re-read, and a new index is saved for the next run.
+    """
+    index = load_prompt_index(out_path)
+    new_index = {}
+    previous = None
+    if index:
+        try:
+            previous = open(out_path, 'rb', buffering=1 << 20)
+        except OSError:
+            pass
+    try:
+        with atomic_output(out_path) as out:
+            pos = out.write(b"My codebase includes\n")
+            # Each entry's opening quote is written together with the previous
+            # entry's closing quote and separator, so an entry costs two writes.
+            opening = b"'"
+            for file_path, identifier, key, contents in _read_ahead(entries, jobs, index, previous):
+                if isinstance(contents, Future):
+                    try:
+                        contents = contents.result()
+                    except SkippedFile as e:
+                        report(warnings, f"Skipping {file_path}: {e}")
+                        continue
+                    except Exception as e:
+                        report(warnings, f"Error reading {file_path}: {e}")
+                        continue
+
+                # Skip if the file is empty after stripping whitespace.
+                if contents is None:
+                    if key is not None:
+                        new_index[key[0]] = (key[1], key[2], None, None)
+                    continue
+
+                # Escape single quotes to avoid format issues.
+                if "'" in identifier:
+                    identifier = identifier.translate(_ESC)
+                identifier_escaped = identifier.encode('utf-8')
+                pos += out.write(opening + identifier_escaped + b"' with '")
+                if key is not None:
+                    new_index[key[0]] = (key[1], key[2], pos, len(contents))
+                pos += out.write(contents)
+                # Separate entries with commas (and newlines for readability)
+                opening = b"',\n'"
+            out.write(b"\n." if opening == b"'" else b"'\n.")
+            # The previous prompt must be closed before it is replaced (required on Windows).
+            if previous is not None:
+                previous.close()
+    finally:
+        if previous is not None:
+            previous.close()
+    save_prompt_index(out_path, new_index)
+
+
+def write_prompt(files, out_path, jobs=None, warnings=None):
+    """
+    Stream a prompt that lists each file (by its relative path) along with its
+    full contents to out_path, in the format:
 
     My codebase includes
     'relative/path/to/file1' with 'contents of file1',
@@ -133,42 +571,32 @@ def generate_prompt(target_folder, files):
     ...
     .
 
-    Files that are empty (after stripping whitespace) are skipped.
+    files is a list of (path, relative_path, size, mtime_ns) tuples as returned by get_all_files.
+    Entries are written as they are read, so peak memory is bounded by the
+    largest files in flight rather than the whole codebase.
+    Files that are empty (after stripping whitespace) are skipped; zero-byte
+    files are skipped without being opened.
+    Unreadable, binary and oversized files are reported via report(warnings, ...).
     """
-    prompt_lines = []
-    prompt_lines.append("My codebase includes")
-    target_path = Path(target_folder)
-    file_entries = []
+    entries = (entry for entry in files if entry[2])
+    _write_entries(entries, out_path, jobs, warnings)
 
-    for file_path in files:
-        relative_path = file_path.relative_to(target_path).as_posix()
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                contents = f.read()
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            continue
-
-        # Skip if the file is empty after stripping whitespace.
-        if not contents.strip():
-            continue
 
-        # Escape single quotes to avoid format issues.
-        relative_path_escaped = relative_path.replace("'", "\\'")
-        contents_escaped = contents.replace("'", "\\'")
-        entry = f"'{relative_path_escaped}' with '{contents_escaped}'"
-        file_entries.append(entry)
-
-    # Join the file entries with commas (and newlines for readability)
-    prompt_body = ",\n".join(file_entries)
-    prompt_lines.append(prompt_body)
-    prompt_lines.append(".")
-    return "\n".join(prompt_lines)
+def _stat_entry(file_path, path_str):
+    """
+    Build a (file_path, identifier, size, mtime_ns) entry for an individually selected file.
+    If the file cannot be stat'ed it is left uncached and the read reports the error.
+    """
+    try:
+        st = os.stat(path_str)
+    except OSError:
+        return file_path, path_str, None, None
+    return file_path, path_str, st.st_size, st.st_mtime_ns
 
 
-def generate_prompt_individual(files):
+def write_prompt_individual(files, out_path, jobs=None, warnings=None):
     """
-    Generate a prompt string for individually selected files.
+    Stream a prompt for individually selected files to out_path.
     Uses the full file path as provided and includes each file's content in the format:
 
     My codebase includes
@@ -177,65 +605,82 @@ def generate_prompt_individual(files):
     ...
     .
 
+    files is a list of (Path, path string) tuples as returned by read_file_list.
     Files that are empty (after stripping whitespace) are skipped.
+    Unreadable, binary and oversized files are reported via report(warnings, ...).
     """
-    prompt_lines = []
-    prompt_lines.append("My codebase includes")
-    file_entries = []
+    entries = (_stat_entry(file_path, path_str) for file_path, path_str in files)
+    _write_entries(entries, out_path, jobs, warnings)
 
-    for file_path in files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                contents = f.read()
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            continue
 
-        if not contents.strip():
-            continue
+def save_individual_files_script(files):
+    """
+    Generate a shell script with the list of individually selected file paths,
+    given as (Path, path string) tuples.
+    """
+    with open(INDIVIDUAL_FILES_SCRIPT, 'w', encoding='utf-8') as f:
+        f.write("#!/bin/bash\n"
+                "# Script containing file paths used for prompt generation.\n"
+                "# You can use this file as input for future runs.\n\n")
+        # Write the paths with one join per chunk rather than one write per file;
+        # chunking keeps the joined string small for very long lists.
+        for start in range(0, len(files), SCRIPT_WRITE_CHUNK):
+            chunk = files[start:start + SCRIPT_WRITE_CHUNK]
+            f.write("\n".join(path_str for _, path_str in chunk) + "\n")
+    print(f"Script with file paths saved to '{INDIVIDUAL_FILES_SCRIPT}'.")
 
-        file_identifier = str(file_path)
-        file_identifier_escaped = file_identifier.replace("'", "\\'")
-        contents_escaped = contents.replace("'", "\\'")
-        entry = f"'{file_identifier_escaped}' with '{contents_escaped}'"
-        file_entries.append(entry)
 
-    prompt_body = ",\n".join(file_entries)
-    prompt_lines.append(prompt_body)
-    prompt_lines.append(".")
-    return "\n".join(prompt_lines)
+# Paths already confirmed to be files by is_valid_file.
+_valid_files = set()
 
 
-def save_individual_files_script(files):
+def is_valid_file(file_path):
     """
-    Generate a shell script with the list of individually selected file paths.
+    os.path.isfile that remembers positive answers, so a path listed in more than
+    one place (target file and interactive input) is only stat'ed once per run.
+    Negative answers are not cached: a file created after being rejected is
+    accepted on the next attempt.
     """
-    with open(INDIVIDUAL_FILES_SCRIPT, 'w', encoding='utf-8') as f:
-        f.write("#!/bin/bash\n")
-        f.write("# Script containing file paths used for prompt generation.\n")
-        f.write("# You can use this file as input for future runs.\n\n")
-        for file_path in files:
-            f.write(str(file_path) + "\n")
-    print(f"Script with file paths saved to '{INDIVIDUAL_FILES_SCRIPT}'.")
+    if file_path in _valid_files:
+        return True
+    if os.path.isfile(file_path):
+        _valid_files.add(file_path)
+        return True
+    return False
+
+
+def read_file_list(list_path, warnings=None, skip_comments=False):
+    """
+    Read file paths, one per line, from list_path and keep those that are valid files.
+    Blank lines are ignored, as are lines starting with '#' when skip_comments is set.
+    Invalid paths are reported via report(warnings, ...).
+    Returns a list of (Path, path string) tuples; the string is computed once here
+    so later stages do not have to stringify the Path again.
+    """
+    file_paths = []
+    with open(list_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            file_path = line.strip()
+            if not file_path or (skip_comments and file_path.startswith("#")):
+                continue
+            if is_valid_file(file_path):
+                path_obj = Path(file_path)
+                file_paths.append((path_obj, str(path_obj)))
+            else:
+                report(warnings, f"Warning: '{file_path}' from '{list_path}' is not a valid file. Skipping.")
+    return file_paths
 
 
-def load_individual_files_from_file():
+def load_individual_files_from_file(warnings=None):
     """
     Load individual file paths from 'target_files.txt' if available.
     If not, attempt to load from 'individual_files.sh' (ignoring shebang/comments).
-    Returns a list of Path objects.
+    Invalid paths are reported via report(warnings, ...).
+    Returns a list of (Path, path string) tuples.
     """
-    file_paths = []
     # First, try target_files.txt
     if os.path.exists(TARGET_FILES_FILE):
-        with open(TARGET_FILES_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                file_path = line.strip()
-                if file_path:
-                    if os.path.isfile(file_path):
-                        file_paths.append(Path(file_path))
-                    else:
-                        print(f"Warning: '{file_path}' from '{TARGET_FILES_FILE}' is not a valid file. Skipping.")
+        file_paths = read_file_list(TARGET_FILES_FILE, warnings)
         if file_paths:
             print(f"Loaded {len(file_paths)} file paths from '{TARGET_FILES_FILE}'.")
             return file_paths
@@ -243,16 +688,8 @@ def load_individual_files_from_file():
             print(f"'{TARGET_FILES_FILE}' exists but contains no valid file paths.")
     # Fallback to individual_files.sh if target_files.txt did not yield any files.
     if os.path.exists(INDIVIDUAL_FILES_SCRIPT):
-        with open(INDIVIDUAL_FILES_SCRIPT, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip shebang and comment lines
-                if line.startswith("#") or not line:
-                    continue
-                if os.path.isfile(line):
-                    file_paths.append(Path(line))
-                else:
-                    print(f"Warning: '{line}' from '{INDIVIDUAL_FILES_SCRIPT}' is not a valid file. Skipping.")
+        # Skip shebang and comment lines
+        file_paths = read_file_list(INDIVIDUAL_FILES_SCRIPT, warnings, skip_comments=True)
         if file_paths:
             print(f"Loaded {len(file_paths)} file paths from '{INDIVIDUAL_FILES_SCRIPT}'.")
             return file_paths
@@ -262,79 +699,131 @@ def load_individual_files_from_file():
     return None
 
 
+def build_argparser():
+    """
+    Build the command-line argument parser.
+    Passing --mode runs the whole pipeline non-interactively; without it the
+    script asks for everything it needs, using the other options as defaults.
+    """
+    parser = argparse.ArgumentParser(description="Generate a single prompt containing your codebase.")
+    parser.add_argument('--mode', choices=('bulk', 'individual'),
+                        help="selection mode; when given, no questions are asked")
+    parser.add_argument('--target', metavar='DIR',
+                        help="target folder of the codebase (bulk mode)")
+    parser.add_argument('--ignore-from', metavar='FILE', default=IGNORE_FILE,
+                        help=f"file listing paths to ignore (bulk mode, default: {IGNORE_FILE})")
+    parser.add_argument('--files-from', metavar='FILE',
+                        help="file listing the paths to include, one per line (individual mode)")
+    parser.add_argument('--output', metavar='FILE', default=OUTPUT_FILE,
+                        help=f"where to save the prompt (default: {OUTPUT_FILE})")
+    parser.add_argument('--jobs', metavar='N', type=int,
+                        help=f"number of threads reading files (default: {READ_WORKERS})")
+    parser.add_argument('--resolve-symlinks', action='store_true',
+                        help="match absolute ignore paths against the targets of symlinked files")
+    parser.add_argument('--verbose', action='store_true',
+                        help="print a line for every skipped file instead of a single summary")
+    return parser
+
+
 def main():
+    parser = build_argparser()
+    args = parser.parse_args()
+    if args.mode is None and (args.target or args.files_from):
+        parser.error("--target and --files-from require --mode")
+    if args.mode == 'bulk' and not args.target:
+        parser.error("--mode bulk requires --target")
+    if args.mode == 'individual' and not args.files_from:
+        parser.error("--mode individual requires --files-from")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    interactive = args.mode is None
+    # Per-file warnings are collected and summarized at the end unless --verbose is given.
+    warnings = None if args.verbose else []
+
     print("=== Codebase Prompt Generator ===")
 
     # Ask user for selection mode.
-    while True:
+    mode = args.mode
+    while mode is None:
         mode = input("Select mode: (bulk/individual): ").strip().lower()
-        if mode in ('bulk', 'individual'):
-            break
-        print("Invalid input. Please enter 'bulk' or 'individual'.")
+        if mode not in ('bulk', 'individual'):
+            print("Invalid input. Please enter 'bulk' or 'individual'.")
+            mode = None
 
     if mode == 'bulk':
         # Bulk selection mode: use a target folder and ignore paths.
-        target_folder = input("Enter the target folder path of your codebase: ").strip()
+        target_folder = args.target or input("Enter the target folder path of your codebase: ").strip()
         if not os.path.isdir(target_folder):
             print(f"Error: '{target_folder}' is not a valid directory.")
             sys.exit(1)
 
         # Load (or initialize) the ignore paths.
-        ignore_set = load_ignore_paths()
+        ignore_spec = load_ignore_paths(args.ignore_from)
 
         # Ask the user if they want to update the ignore list.
-        update_ignore = input("Would you like to update the ignore paths? (y/n): ").strip().lower()
+        update_ignore = 'n'
+        if interactive:
+            update_ignore = input("Would you like to update the ignore paths? (y/n): ").strip().lower()
         if update_ignore == 'y':
-            ignore_set = prompt_for_ignore_paths(ignore_set)
-            save_ignore_paths(ignore_set)
-            print(f"\nIgnore paths updated and saved to '{IGNORE_FILE}'.")
+            ignore_spec = prompt_for_ignore_paths(ignore_spec)
+            save_ignore_paths(ignore_spec, args.ignore_from)
+            print(f"\nIgnore paths updated and saved to '{args.ignore_from}'.")
         else:
             print("\nUsing existing ignore paths.")
 
         # Scan the target folder.
         print("\nScanning codebase...")
-        files = get_all_files(target_folder, ignore_set)
+        files = get_all_files(target_folder, ignore_spec, args.resolve_symlinks, warnings)
         print(f"Found {len(files)} files to include in the prompt.")
 
-        # Generate the final prompt text.
-        prompt_text = generate_prompt(target_folder, files)
+        # Stream the final prompt to the output file.
+        write_prompt(files, args.output, args.jobs, warnings)
     else:
         # Individual selection mode.
         individual_files = []
 
-        # Ask if user wants to load paths from file.
-        load_from_file_option = input(
-            f"Load file paths from '{TARGET_FILES_FILE}' (or fallback to '{INDIVIDUAL_FILES_SCRIPT}') if available? (y/n): ").strip().lower()
-        if load_from_file_option == 'y':
-            loaded_files = load_individual_files_from_file()
-            if loaded_files:
-                individual_files.extend(loaded_files)
+        if args.files_from:
+            if not os.path.isfile(args.files_from):
+                print(f"Error: '{args.files_from}' is not a valid file.")
+                sys.exit(1)
+            individual_files.extend(read_file_list(args.files_from, warnings, skip_comments=True))
+            print(f"Loaded {len(individual_files)} file paths from '{args.files_from}'.")
+        else:
+            # Ask if user wants to load paths from file.
+            load_from_file_option = input(
+                f"Load file paths from '{TARGET_FILES_FILE}' (or fallback to '{INDIVIDUAL_FILES_SCRIPT}') if available? (y/n): ").strip().lower()
+            if load_from_file_option == 'y':
+                loaded_files = load_individual_files_from_file(warnings)
+                if loaded_files:
+                    individual_files.extend(loaded_files)
 
         # Now allow the user to add additional file paths.
-        print("You may now add additional file paths. Type 'done' when finished.")
-        while True:
+        if interactive:
+            print("You may now add additional file paths. Type 'done' when finished.")
+        while interactive:
             file_input = input("File path (or 'done'): ").strip()
             if file_input.lower() == "done":
                 break
-            if not os.path.isfile(file_input):
+            if not is_valid_file(file_input):
                 print(f"Warning: '{file_input}' is not a valid file. Please try again.")
                 continue
-            individual_files.append(Path(file_input))
+            path_obj = Path(file_input)
+            individual_files.append((path_obj, str(path_obj)))
 
         if individual_files:
             print(f"Collected {len(individual_files)} files for inclusion in the prompt.")
-            # Generate the final prompt text using the individually selected files.
-            prompt_text = generate_prompt_individual(individual_files)
+            # Stream the final prompt using the individually selected files.
+            write_prompt_individual(individual_files, args.output, args.jobs, warnings)
             # Generate script with file paths.
             save_individual_files_script(individual_files)
         else:
-            prompt_text = "No files selected for individual prompt generation."
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write("No files selected for individual prompt generation.")
             print("No files were selected for prompt generation.")
 
-    # Write the prompt to the output file.
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(prompt_text)
-    print(f"\nPrompt generated and saved to '{OUTPUT_FILE}'.")
+    if warnings:
+        print(f"\nSkipped {len(warnings)} paths (run with --verbose to list them).")
+    print(f"\nPrompt generated and saved to '{args.output}'.")
 
 
 if __name__ == '__main__':